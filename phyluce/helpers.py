@@ -11,7 +11,6 @@ Copyright 2011 Brant C. Faircloth. All rights reserved.
 import os
 import re
 import sys
-import glob
 import argparse
 import shutil
 import ConfigParser
@@ -266,12 +265,24 @@ def get_file_extensions(ftype):
     return ext[ftype]
 
 
+def list_alignment_files(input_dir, input_format):
+    # one pass over the directory rather than one glob per extension
+    extensions = get_file_extensions(input_format)
+    return [
+        os.path.join(input_dir, name) for name in os.listdir(input_dir)
+        if name.endswith(extensions) and not name.startswith('.')
+    ]
+
+
 def get_alignment_files(log, input_dir, input_format):
     log.info("Getting alignment files")
-    alignments = []
-    for ftype in get_file_extensions(input_format):
-        alignments.extend(glob.glob(os.path.join(input_dir, "*{}".format(ftype))))
-    return alignments
+    return list_alignment_files(input_dir, input_format)
+
+
+def get_pool_chunksize(work, cores):
+    """return a multiprocessing.Pool chunksize that hands out work in
+    about four chunks per core, to reduce IPC overhead per item"""
+    return max(1, len(work) // (cores * 4))
 
 
 def write_alignments_to_outdir(log, outdir, alignments, format):